@@ -6,10 +6,67 @@ Script de demostración que muestra el análisis DSP sin interfaz gráfica.
 """
 
 import numpy as np
-from groove_analyzer import GrooveAnalyzer
 import json
 
-def create_test_audio():
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _synth_audio(sr, duration, tempo_bpm, seed=None):
+    """Sintetiza kicks en cada beat y hihats en los offbeats.
+
+    Devuelve el buffer mono como np.ndarray. Con una semilla fija el
+    resultado es reproducible.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Crear audio con pulsos simulados (kick drums cada beat), en float32
+    audio = np.zeros(int(sr * duration), dtype=np.float32)
+
+    # Posiciones de todos los beats (cada 0.5 segundos a 120 BPM)
+    beat_interval = 60.0 / tempo_bpm
+    beat_times = np.arange(int(duration / beat_interval)) * beat_interval
+
+    # Kick sintético: oscilador descendente, igual para todos los beats
+    pulse_duration = 0.05  # 50ms
+    pulse_samples = int(pulse_duration * sr)
+    freq_start = 150
+    freq_end = 50
+    # Fase en forma cerrada: suma acumulada de un barrido lineal
+    # freq_start -> freq_end (equivale a cumsum(2*pi*linspace(...)/sr))
+    n = np.arange(pulse_samples)
+    sweep_slope = (freq_end - freq_start) / (pulse_samples - 1)
+    phase = (2 * np.pi / sr) * (n + 1) * (freq_start + 0.5 * sweep_slope * n)
+    envelope = np.exp(-np.linspace(0, 10, pulse_samples))
+    kick = np.sin(phase) * envelope
+
+    kick_samples = (beat_times * sr).astype(int)
+    kick_samples = kick_samples[kick_samples + pulse_samples < len(audio)]
+
+    # Aplicar variación de velocidad por beat y sumar todos los pulsos de una vez
+    amplitudes = 0.5 + rng.uniform(-0.2, 0.3, size=len(kick_samples))
+    kick_idx = kick_samples[:, None] + np.arange(pulse_samples)
+    np.add.at(audio, kick_idx, (amplitudes[:, None] * kick).astype(np.float32))
+
+    # Añadir hihat en offbeats (beats impares)
+    hihat_duration = 0.02
+    hihat_samples = int(hihat_duration * sr)
+    hihat_envelope = np.exp(-np.linspace(0, 20, hihat_samples))
+
+    hihat_starts = ((beat_times[1::2] + 0.25) * sr).astype(int)
+    hihat_starts = hihat_starts[hihat_starts + hihat_samples < len(audio)]
+
+    # Hihat: ruido filtrado
+    noise = rng.standard_normal((len(hihat_starts), hihat_samples))
+    hihat_idx = hihat_starts[:, None] + np.arange(hihat_samples)
+    np.add.at(audio, hihat_idx, (0.2 * noise * hihat_envelope).astype(np.float32))
+
+    return audio
+
+
+def create_test_audio(seed=None):
     """Crea un archivo de audio de prueba con pulsos simulados."""
     print("📁 Creando archivo de audio de prueba...")
 
@@ -18,54 +75,14 @@ def create_test_audio():
     duration = 4.0  # 4 segundos
     tempo_bpm = 120
 
-    # Crear audio con pulsos simulados (kick drums cada beat)
-    t = np.linspace(0, duration, int(sr * duration))
-    audio = np.zeros_like(t)
-
-    # Añadir pulsos cada 0.5 segundos (120 BPM)
-    beat_interval = 60.0 / tempo_bpm
-    for beat in range(int(duration / beat_interval)):
-        beat_time = beat * beat_interval
-        beat_sample = int(beat_time * sr)
-
-        # Crear un pulso (kick drum sintético)
-        pulse_duration = 0.05  # 50ms
-        pulse_samples = int(pulse_duration * sr)
-
-        if beat_sample + pulse_samples < len(audio):
-            # Señal de kick: oscilador descendente
-            freq_start = 150
-            freq_end = 50
-            freq_sweep = np.linspace(freq_start, freq_end, pulse_samples)
-            phase = np.cumsum(2 * np.pi * freq_sweep / sr)
-
-            # Envelope
-            envelope = np.exp(-np.linspace(0, 10, pulse_samples))
-
-            # Aplicar variación de velocidad
-            amplitude = 0.5 + np.random.uniform(-0.2, 0.3)
-
-            pulse = amplitude * np.sin(phase) * envelope
-            audio[beat_sample:beat_sample + pulse_samples] = pulse
-
-        # Añadir hihat en offbeats
-        if beat % 2 == 1:
-            hihat_time = beat_time + 0.25
-            hihat_sample = int(hihat_time * sr)
-            hihat_duration = 0.02
-            hihat_samples = int(hihat_duration * sr)
-
-            if hihat_sample + hihat_samples < len(audio):
-                # Hihat: ruido filtrado
-                noise = np.random.randn(hihat_samples)
-                hihat_envelope = np.exp(-np.linspace(0, 20, hihat_samples))
-                hihat = 0.2 * noise * hihat_envelope
-                audio[hihat_sample:hihat_sample + hihat_samples] += hihat
+    audio = _synth_audio(sr, duration, tempo_bpm, seed)
 
     # Guardar archivo
     import soundfile as sf
     test_file = "/tmp/test_groove.wav"
-    sf.write(test_file, audio, sr)
+    with sf.SoundFile(test_file, mode='w', samplerate=sr, channels=1,
+                      subtype='FLOAT') as f:
+        f.write(audio)
 
     print(f"✅ Audio de prueba creado: {test_file}")
     print(f"   - Duración: {duration}s")
@@ -77,6 +94,8 @@ def create_test_audio():
 
 def run_demo():
     """Ejecuta una demostración completa del análisis."""
+    # Import diferido: groove_analyzer arrastra librosa/scipy
+    from groove_analyzer import GrooveAnalyzer
 
     print("="*70)
     print("🥁 GROOVE EXTRACTOR - DEMOSTRACIÓN DSP")
@@ -144,14 +163,18 @@ def run_demo():
     print(f"{'#':<4} {'Tiempo':<10} {'Beat Pos':<10} {'Tipo':<8} {'Vel':<5} {'dB':<8} {'Dev (ms)':<10}")
     print("-"*70)
 
-    for i, onset in enumerate(results['groove_data'][:10], 1):
-        print(f"{i:<4} "
-              f"{onset['onset_time']:<10.3f} "
-              f"{onset['beat_position']:<10.2f} "
-              f"{onset['drum_type']:<8} "
-              f"{onset['velocity']:<5} "
-              f"{onset['amplitude_db']:<8.2f} "
-              f"{onset['timing_deviation_ms']:<10.2f}")
+    rows = [
+        f"{i:<4} "
+        f"{onset['onset_time']:<10.3f} "
+        f"{onset['beat_position']:<10.2f} "
+        f"{onset['drum_type']:<8} "
+        f"{onset['velocity']:<5} "
+        f"{onset['amplitude_db']:<8.2f} "
+        f"{onset['timing_deviation_ms']:<10.2f}"
+        for i, onset in enumerate(results['groove_data'][:10], 1)
+    ]
+    if rows:
+        print("\n".join(rows))
 
     print()
     print("ESTADÍSTICAS DE HUMANIZACIÓN:")
@@ -161,8 +184,14 @@ def run_demo():
 
     # 9. Exportar JSON
     output_json = "/tmp/groove_analysis_demo.json"
-    with open(output_json, 'w') as f:
-        json.dump(results, f, indent=2)
+    if HAS_ORJSON:
+        with open(output_json, 'wb') as f:
+            f.write(orjson.dumps(
+                results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+    else:
+        with open(output_json, 'w') as f:
+            json.dump(results, f, indent=2)
 
     print("="*70)
     print(f"✅ Resultados exportados a: {output_json}")
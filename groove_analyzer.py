@@ -5,8 +5,6 @@ Implementa detección de onsets, análisis de dinámica y micro-timing.
 """
 
 import numpy as np
-import librosa
-import soundfile as sf
 from datetime import datetime
 from pathlib import Path
 
@@ -29,9 +27,17 @@ class GrooveAnalyzer:
         self.audio_file = None
         self.onsets = None
         self.onset_strengths = None
+        self.mel_spec_db = None
         self.groove_data = []
         self.metadata = {}
 
+        # Columnas de groove_data como arrays paralelos (mismo orden)
+        self._onset_times_arr = np.empty(0)
+        self._velocities_arr = np.empty(0, dtype=int)
+        self._timing_devs_arr = np.empty(0)
+        self._beat_positions_arr = np.empty(0)
+        self._velocity_vars_arr = np.empty(0)
+
     def load_audio(self, audio_file):
         """
         Carga un archivo de audio.
@@ -39,8 +45,20 @@ class GrooveAnalyzer:
         Args:
             audio_file (str): Path al archivo de audio WAV
         """
+        # Imports diferidos: librosa/soundfile tardan en cargar y solo se
+        # necesitan al analizar audio
+        import soundfile as sf
+
         self.audio_file = audio_file
-        self.audio, self.sr = librosa.load(audio_file, sr=None)
+        try:
+            # Lectura directa en float32 al sample rate nativo
+            audio, self.sr = sf.read(audio_file, dtype='float32', always_2d=True)
+            # (n_samples, n_canales) -> mono
+            self.audio = audio.mean(axis=1) if audio.shape[1] > 1 else audio[:, 0]
+        except RuntimeError:
+            # Formato no soportado por libsndfile
+            import librosa
+            self.audio, self.sr = librosa.load(audio_file, sr=None)
 
         # Guardar metadata
         self.metadata['audio_file'] = Path(audio_file).name
@@ -58,11 +76,24 @@ class GrooveAnalyzer:
             raise ValueError("Primero debes cargar un archivo de audio")
 
         if method == 'librosa':
+            import librosa
+
             # Usar librosa para detección de onsets
             # Configuración optimizada para batería
             hop_length = 512
+
+            # Espectrograma mel en dB, calculado una sola vez y guardado
+            # para reutilizarlo (es el mismo que onset_strength calcularia)
+            self.mel_spec_db = librosa.power_to_db(
+                librosa.feature.melspectrogram(
+                    y=self.audio,
+                    sr=self.sr,
+                    hop_length=hop_length
+                )
+            )
+
             onset_env = librosa.onset.onset_strength(
-                y=self.audio,
+                S=self.mel_spec_db,
                 sr=self.sr,
                 hop_length=hop_length,
                 aggregate=np.median
@@ -122,34 +153,50 @@ class GrooveAnalyzer:
 
         # Ventana para análisis de amplitud (±25ms alrededor del onset)
         window_size = int(0.025 * self.sr)
-
-        for i, onset_time in enumerate(self.onsets):
-            onset_sample = int(onset_time * self.sr)
-
-            # Extraer ventana alrededor del onset
-            start = max(0, onset_sample - window_size)
-            end = min(len(self.audio), onset_sample + window_size)
-            window = self.audio[start:end]
-
-            # Calcular RMS (amplitud)
-            rms = np.sqrt(np.mean(window**2))
-
-            # Convertir a dB
-            amplitude_db = 20 * np.log10(rms + 1e-10)
-
-            # Estimar velocidad MIDI (0-127)
-            # Mapear dB a MIDI velocity (típicamente -60dB a -6dB)
-            velocity = self._db_to_velocity(amplitude_db)
-
-            # Crear entrada de groove data
-            onset_data = {
-                'onset_time': float(onset_time),
-                'velocity': int(velocity),
-                'amplitude_db': float(amplitude_db),
-                'onset_strength': float(self.onset_strengths[i]) if i < len(self.onset_strengths) else 1.0
-            }
-
-            self.groove_data.append(onset_data)
+        n_samples = len(self.audio)
+
+        # Extraer todas las ventanas de una vez: (n_onsets, 2 * window_size).
+        # Las muestras fuera del audio se enmascaran para conservar el
+        # recorte [max(0, s - w), min(len, s + w)) de cada ventana.
+        onset_samples = (np.asarray(self.onsets) * self.sr).astype(np.int64)
+        idx = onset_samples[:, None] + np.arange(-window_size, window_size)
+        valid = (idx >= 0) & (idx < n_samples)
+        windows = self.audio[np.clip(idx, 0, n_samples - 1)]
+        windows = np.where(valid, windows, 0)
+
+        # Calcular RMS (amplitud)
+        counts = valid.sum(axis=1).astype(windows.dtype)
+        rms = np.sqrt((windows**2).sum(axis=1) / counts)
+
+        # Convertir a dB
+        amplitudes_db = 20 * np.log10(rms + 1e-10)
+
+        # Estimar velocidad MIDI (0-127)
+        # Mapear dB a MIDI velocity (típicamente -60dB a -6dB)
+        velocities = self._db_to_velocity(amplitudes_db)
+
+        onset_times = np.asarray(self.onsets, dtype=float)
+        self._onset_times_arr = np.concatenate([self._onset_times_arr, onset_times])
+        self._velocities_arr = np.concatenate([self._velocities_arr, velocities])
+
+        # Fuerza de onset (1.0 si no hay dato para ese onset)
+        strengths = np.ones(len(onset_samples))
+        n_strengths = min(len(strengths), len(self.onset_strengths))
+        strengths[:n_strengths] = self.onset_strengths[:n_strengths]
+
+        # Crear entradas de groove data
+        for onset_time, velocity, amplitude_db, strength in zip(
+            onset_times.tolist(),
+            velocities.tolist(),
+            amplitudes_db.tolist(),
+            strengths.tolist()
+        ):
+            self.groove_data.append({
+                'onset_time': onset_time,
+                'velocity': velocity,
+                'amplitude_db': amplitude_db,
+                'onset_strength': strength
+            })
 
     def calculate_timing_deviations(self, tempo_bpm):
         """
@@ -172,43 +219,56 @@ class GrooveAnalyzer:
         self.metadata['tempo_bpm'] = float(tempo_bpm)
         self.metadata['time_signature'] = "4/4"  # Default
 
-        # Calcular desviaciones para cada onset
-        for onset_data in self.groove_data:
-            onset_time = onset_data['onset_time']
+        # Calcular desviaciones para todos los onsets a la vez
+        onset_times = self._onset_times_arr
 
-            # Encontrar la posición más cercana en el grid
-            grid_position = round(onset_time / grid_interval)
-            expected_time = grid_position * grid_interval
+        # Encontrar la posición más cercana en el grid
+        # (np.rint redondea al par en empates, igual que round())
+        expected_times = np.rint(onset_times / grid_interval) * grid_interval
 
-            # Calcular desviación en milisegundos
-            timing_deviation_ms = (onset_time - expected_time) * 1000
+        # Calcular desviación en milisegundos
+        timing_deviations_ms = (onset_times - expected_times) * 1000
 
-            # Calcular beat position (1.0, 1.25, 1.5, etc.)
-            beat_position = (onset_time / beat_interval) % 4 + 1
+        # Calcular beat position (1.0, 1.25, 1.5, etc.)
+        beat_positions = (onset_times / beat_interval) % 4 + 1
 
-            # Calcular bar number
-            bar_number = int(onset_time / (beat_interval * 4)) + 1
+        # Calcular bar number
+        bar_numbers = (onset_times / (beat_interval * 4)).astype(int) + 1
 
-            # Añadir campos
-            onset_data['timing_deviation_ms'] = float(timing_deviation_ms)
-            onset_data['beat_position'] = float(beat_position)
-            onset_data['bar_number'] = int(bar_number)
+        # Clasificación básica de instrumento (placeholder - podría mejorarse con ML)
+        drum_types = self._classify_drum_type(self._velocities_arr, beat_positions)
+
+        # Variación de velocidad normalizada
+        velocity_variations = self._calculate_velocity_variation(self._velocities_arr)
 
-            # Clasificación básica de instrumento (placeholder - podría mejorarse con ML)
-            onset_data['drum_type'] = self._classify_drum_type(onset_data)
+        self._timing_devs_arr = timing_deviations_ms
+        self._beat_positions_arr = beat_positions
+        self._velocity_vars_arr = velocity_variations
 
-            # Variación de velocidad normalizada
-            onset_data['velocity_variation'] = self._calculate_velocity_variation(onset_data)
+        for onset_data, timing_deviation_ms, beat_position, bar_number, drum_type, variation in zip(
+            self.groove_data,
+            timing_deviations_ms.tolist(),
+            beat_positions.tolist(),
+            bar_numbers.tolist(),
+            drum_types.tolist(),
+            velocity_variations.tolist()
+        ):
+            # Añadir campos
+            onset_data['timing_deviation_ms'] = timing_deviation_ms
+            onset_data['beat_position'] = beat_position
+            onset_data['bar_number'] = bar_number
+            onset_data['drum_type'] = drum_type
+            onset_data['velocity_variation'] = variation
 
     def _db_to_velocity(self, db):
         """
         Convierte amplitud en dB a velocidad MIDI (0-127).
 
         Args:
-            db (float): Amplitud en dB
+            db (float o np.ndarray): Amplitud en dB
 
         Returns:
-            int: Velocidad MIDI (0-127)
+            int o np.ndarray: Velocidad MIDI (0-127)
         """
         # Mapeo típico: -60dB = 1, -6dB = 127
         min_db = -60
@@ -219,51 +279,47 @@ class GrooveAnalyzer:
 
         # Mapeo lineal
         velocity = ((db - min_db) / (max_db - min_db)) * 127
+        velocity = np.clip(velocity, 1, 127).astype(int)
 
-        return int(np.clip(velocity, 1, 127))
+        return int(velocity) if velocity.ndim == 0 else velocity
 
-    def _classify_drum_type(self, onset_data):
+    def _classify_drum_type(self, velocities, beat_positions):
         """
         Clasificación básica de tipo de instrumento basada en características.
 
         Args:
-            onset_data (dict): Datos del onset
+            velocities (np.ndarray): Velocidades MIDI de los onsets
+            beat_positions (np.ndarray): Posiciones de beat de los onsets
 
         Returns:
-            str: Tipo de instrumento estimado
+            np.ndarray: Tipo de instrumento estimado para cada onset
         """
         # Clasificación simple basada en velocidad y timing
         # En producción, esto debería usar ML o análisis espectral
 
-        velocity = onset_data['velocity']
-        beat_pos = onset_data['beat_position'] % 1
-
-        # Heurística simple
-        if beat_pos < 0.1 or abs(beat_pos - 0.5) < 0.1:
-            # Onsets en beats fuertes
-            if velocity > 90:
-                return 'kick'
-            else:
-                return 'snare'
-        else:
-            # Subdivisiones
-            return 'hihat'
-
-    def _calculate_velocity_variation(self, onset_data):
+        beat_pos = np.asarray(beat_positions) % 1
+
+        # Heurística simple: onsets en beats fuertes -> kick/snare,
+        # subdivisiones -> hihat
+        on_beat = (beat_pos < 0.1) | (np.abs(beat_pos - 0.5) < 0.1)
+        strong = np.asarray(velocities) > 90
+
+        return np.where(on_beat, np.where(strong, 'kick', 'snare'), 'hihat')
+
+    def _calculate_velocity_variation(self, velocities):
         """
         Calcula la variación de velocidad normalizada.
 
         Args:
-            onset_data (dict): Datos del onset
+            velocities (np.ndarray): Velocidades MIDI de los onsets
 
         Returns:
-            float: Variación normalizada (0.0-1.0)
+            np.ndarray: Variación normalizada (0.0-1.0) de cada onset
         """
         # Placeholder: en producción calcular respecto a media local
         # Por ahora, usar una función simple basada en la velocidad
-        velocity = onset_data['velocity']
-        variation = abs(velocity - 85) / 127.0
-        return float(np.clip(variation, 0.0, 1.0))
+        variation = np.abs(np.asarray(velocities) - 85) / 127.0
+        return np.clip(variation, 0.0, 1.0)
 
     def get_results(self):
         """
@@ -276,8 +332,8 @@ class GrooveAnalyzer:
             raise ValueError("No hay datos de groove. Ejecuta el análisis primero.")
 
         # Calcular estadísticas de humanización
-        timing_devs = [d['timing_deviation_ms'] for d in self.groove_data]
-        velocity_vars = [d['velocity_variation'] for d in self.groove_data]
+        timing_devs = self._timing_devs_arr
+        velocity_vars = self._velocity_vars_arr
 
         humanization_stats = {
             'avg_timing_deviation_ms': float(np.mean(timing_devs)),
@@ -305,23 +361,15 @@ class GrooveAnalyzer:
         """
         # Analizar desviaciones en subdivisiones impares vs pares
         # Placeholder: implementación simplificada
-        if len(self.groove_data) < 4:
+        if len(self._timing_devs_arr) < 4:
             return 0.0
 
         # Calcular diferencia promedio entre subdivisiones pares e impares
-        even_devs = []
-        odd_devs = []
-
-        for onset in self.groove_data:
-            beat_pos = onset['beat_position']
-            frac = beat_pos % 0.5
-
-            if frac < 0.25:
-                even_devs.append(onset['timing_deviation_ms'])
-            else:
-                odd_devs.append(onset['timing_deviation_ms'])
+        even = (self._beat_positions_arr % 0.5) < 0.25
+        even_devs = self._timing_devs_arr[even]
+        odd_devs = self._timing_devs_arr[~even]
 
-        if even_devs and odd_devs:
+        if even_devs.size and odd_devs.size:
             swing = abs(np.mean(odd_devs) - np.mean(even_devs)) / 100.0
             return float(np.clip(swing, 0.0, 1.0))
 
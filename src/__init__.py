@@ -21,18 +21,44 @@ Uso rapido:
     groove = extract_groove("audio.wav")
 """
 
-from .groove_extractor import (
-    GrooveExtractor, ExtractorConfig, extract_groove,
-    detect_bpm_only, BPMResult
-)
-from .models import (
-    OnsetData, OnsetList,
-    HiHatType, HiHatFeatures, HiHatClassification,
-    GridPosition, TickData, BarData, time_to_tick, tick_to_time,
-    JamaicanStyle, STYLE_BPM_RANGES, suggest_style_from_bpm,
-    SwingAnalysis, SWING_RANGES_BY_STYLE,
-    GrooveData, InstrumentData, GridMapping, HumanizationStats
-)
+import importlib
+
+# Re-exports perezosos (PEP 562): cada simbolo se importa en el primer
+# acceso, para que importar el paquete no arrastre numpy/librosa.
+_LAZY_IMPORTS = {
+    '.groove_extractor': (
+        'GrooveExtractor', 'ExtractorConfig', 'extract_groove',
+        'detect_bpm_only', 'BPMResult',
+    ),
+    '.models': (
+        'OnsetData', 'OnsetList',
+        'HiHatType', 'HiHatFeatures', 'HiHatClassification',
+        'GridPosition', 'TickData', 'BarData', 'time_to_tick', 'tick_to_time',
+        'JamaicanStyle', 'STYLE_BPM_RANGES', 'suggest_style_from_bpm',
+        'SwingAnalysis', 'SWING_RANGES_BY_STYLE',
+        'GrooveData', 'InstrumentData', 'GridMapping', 'HumanizationStats',
+    ),
+}
+
+_LAZY = {
+    name: module
+    for module, names in _LAZY_IMPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __version__ = "2.0.0"
 
@@ -9,6 +9,16 @@ from ..models import (
 )
 
 
+# Estilos que NUNCA deben tener BPM > 130
+_SLOW_STYLES = frozenset({
+    JamaicanStyle.ONE_DROP,
+    JamaicanStyle.ROCKERS,
+    JamaicanStyle.STEPPERS,
+    JamaicanStyle.DUB,
+    JamaicanStyle.ROCKSTEADY,
+})
+
+
 @dataclass
 class BPMAnalysisResult:
     """Resultado del analisis de BPM."""
@@ -147,16 +157,7 @@ class JamaicanBPMAnalyzer:
         bpm_corrected = bpm_detected
         correction_type = "none"
 
-        # Estilos que NUNCA deben tener BPM > 130
-        slow_styles = {
-            JamaicanStyle.ONE_DROP,
-            JamaicanStyle.ROCKERS,
-            JamaicanStyle.STEPPERS,
-            JamaicanStyle.DUB,
-            JamaicanStyle.ROCKSTEADY,
-        }
-
-        if style_hint in slow_styles and bpm_detected > 130:
+        if style_hint in _SLOW_STYLES and bpm_detected > 130:
             # Reggae detectado al doble: DIVIDIR
             bpm_corrected = bpm_detected / 2
             correction_type = "halved"
@@ -1,4 +1,5 @@
 """Conversor de tiempo a ticks MIDI y posiciones en grid."""
+import numpy as np
 from typing import List, Tuple, Optional
 from ..models import (
     OnsetData, OnsetList,
@@ -24,6 +25,8 @@ class TimingConverter:
         self.ticks_per_step = ppq // 4  # 120 ticks por step
         # Ticks por compas (4 negras)
         self.ticks_per_bar = ppq * 4  # 1920 ticks por compas
+        # Milisegundos por tick (constante para un BPM dado)
+        self.ms_per_tick = 60000.0 / (bpm * ppq)
 
     def time_to_tick(self, time_seconds: float) -> int:
         """Convierte tiempo en segundos a ticks MIDI."""
@@ -87,9 +90,7 @@ class TimingConverter:
         grid_position = self.tick_to_grid_position(quantized_tick)
 
         # Convertir desviacion a milisegundos
-        deviation_ms = self.tick_to_time(abs(deviation_ticks)) * 1000
-        if deviation_ticks < 0:
-            deviation_ms = -deviation_ms
+        deviation_ms = deviation_ticks * self.ms_per_tick
 
         return TickData(
             tick=tick,
@@ -125,26 +126,31 @@ class TimingConverter:
             max_bar = max(td.grid_position.bar for td in tick_data_list)
             num_bars = max_bar
 
+        # Repartir tick_data (y su onset) por compas en una sola pasada
+        bar_ticks_list = [[] for _ in range(num_bars)]
+        bar_onsets_list = [[] for _ in range(num_bars)]
+        for td, onset in zip(tick_data_list, onsets.onsets):
+            bar_idx = td.grid_position.bar - 1
+            if bar_idx < num_bars:
+                bar_ticks_list[bar_idx].append(td)
+                bar_onsets_list[bar_idx].append(onset)
+
         # Crear BarData para cada compas
         bar_data_list = []
 
-        for bar_num in range(1, num_bars + 1):
-            # Filtrar tick_data de este compas
-            bar_ticks = [td for td in tick_data_list if td.grid_position.bar == bar_num]
-
+        for bar_num, (bar_ticks, bar_onsets) in enumerate(
+            zip(bar_ticks_list, bar_onsets_list), start=1
+        ):
             # Inicializar pattern y velocities
             pattern = [0] * STEPS_PER_BAR
             velocities = [0] * STEPS_PER_BAR
 
             # Llenar con datos de onsets
-            for td in bar_ticks:
+            for td, onset in zip(bar_ticks, bar_onsets):
                 step_idx = td.grid_position.step - 1  # 0-indexed
                 if 0 <= step_idx < STEPS_PER_BAR:
                     pattern[step_idx] = 1
-                    # Obtener velocity del onset correspondiente
-                    onset_idx = tick_data_list.index(td)
-                    if onset_idx < len(onsets.onsets):
-                        velocities[step_idx] = onsets.onsets[onset_idx].velocity
+                    velocities[step_idx] = onset.velocity
 
             bar_data = BarData(
                 bar_number=bar_num,
@@ -177,12 +183,16 @@ class TimingConverter:
                 max_deviation_ms=0.0
             )
 
-        deviations = [td.deviation_ms for td in tick_data_list]
+        deviations = np.fromiter(
+            (td.deviation_ms for td in tick_data_list),
+            dtype=float, count=len(tick_data_list)
+        )
+        abs_deviations = np.abs(deviations)
 
         # Contar rushing (adelantado), dragging (atrasado), on_grid
-        rushing = sum(1 for d in deviations if d < -tolerance_ms)
-        dragging = sum(1 for d in deviations if d > tolerance_ms)
-        on_grid = sum(1 for d in deviations if abs(d) <= tolerance_ms)
+        rushing = int(np.count_nonzero(deviations < -tolerance_ms))
+        dragging = int(np.count_nonzero(deviations > tolerance_ms))
+        on_grid = int(np.count_nonzero(abs_deviations <= tolerance_ms))
 
         total = len(deviations)
 
@@ -190,6 +200,6 @@ class TimingConverter:
             rushing_percent=rushing / total * 100,
             dragging_percent=dragging / total * 100,
             on_grid_percent=on_grid / total * 100,
-            avg_deviation_ms=sum(abs(d) for d in deviations) / total,
-            max_deviation_ms=max(abs(d) for d in deviations)
+            avg_deviation_ms=float(abs_deviations.mean()),
+            max_deviation_ms=float(abs_deviations.max())
         )
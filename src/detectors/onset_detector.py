@@ -1,40 +1,46 @@
 """Detector de onsets optimizado por instrumento."""
 import numpy as np
 import librosa
+from types import MappingProxyType
 from typing import List
 from ..models import OnsetData, OnsetList
 
 
+# Parametros optimizados por instrumento (solo lectura, compartidos)
+INSTRUMENT_PARAMS = MappingProxyType({
+    'kick': MappingProxyType({
+        'hop_length': 512,
+        'fmin': 20,
+        'fmax': 150,
+        'delta': 0.07,
+        'wait': 30,  # frames entre onsets
+    }),
+    'snare': MappingProxyType({
+        'hop_length': 256,
+        'fmin': 150,
+        'fmax': 5000,
+        'delta': 0.05,
+        'wait': 20,
+    }),
+    'hihat': MappingProxyType({
+        'hop_length': 256,
+        'fmin': 5000,
+        'fmax': 16000,
+        'delta': 0.03,
+        'wait': 10,  # hi-hats pueden estar muy juntos
+    }),
+})
+
+# Instrumento desconocido -> parametros de hihat
+_DEFAULT_PARAMS = INSTRUMENT_PARAMS['hihat']
+
+
 class OnsetDetector:
     """Detecta onsets con parametros optimizados por instrumento."""
 
     def __init__(self, sr: int = 22050):
         self.sr = sr
-
-        # Parametros optimizados por instrumento
-        self.params = {
-            'kick': {
-                'hop_length': 512,
-                'fmin': 20,
-                'fmax': 150,
-                'delta': 0.07,
-                'wait': 30,  # frames entre onsets
-            },
-            'snare': {
-                'hop_length': 256,
-                'fmin': 150,
-                'fmax': 5000,
-                'delta': 0.05,
-                'wait': 20,
-            },
-            'hihat': {
-                'hop_length': 256,
-                'fmin': 5000,
-                'fmax': 16000,
-                'delta': 0.03,
-                'wait': 10,  # hi-hats pueden estar muy juntos
-            }
-        }
+        self.params = INSTRUMENT_PARAMS
 
     def detect(self, y: np.ndarray, instrument: str = 'hihat') -> OnsetList:
         """
@@ -47,7 +53,7 @@ class OnsetDetector:
         Returns:
             OnsetList con los onsets detectados
         """
-        params = self.params.get(instrument, self.params['hihat'])
+        params = self.params.get(instrument, _DEFAULT_PARAMS)
 
         # Filtrar frecuencias relevantes
         y_filtered = self._bandpass_filter(y, params['fmin'], params['fmax'])
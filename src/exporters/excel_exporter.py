@@ -35,6 +35,12 @@ INSTRUMENT_CATALOG = {
     "ride": {"nota_midi": 51, "default_vel": 85, "descripcion": "Ride Cymbal 1"},
 }
 
+# Columnas de datos en los archivos _groove.xlsx, como slices 0-based sobre
+# una fila leida con iter_rows(values_only=True)
+REJILLAS_PATTERN_COLS = slice(2, 18)      # columnas 3-18
+HUMANIZACION_VEL_COLS = slice(2, 18)      # columnas 3-18
+HUMANIZACION_TIMING_COLS = slice(18, 34)  # columnas 19-34
+
 
 class ExcelExporter:
     """
@@ -754,32 +760,33 @@ class DatabaseAggregator:
 
         instruments_data = {}
 
-        for row in range(2, ws_rejillas.max_row + 1):
-            id_patron = ws_rejillas.cell(row=row, column=1).value
+        # Indexar HUMANIZACION por ID una sola vez (primera fila de cada ID)
+        humanizacion_rows = {}
+        for h_row in ws_humanizacion.iter_rows(
+            min_row=2, max_col=HUMANIZACION_TIMING_COLS.stop, values_only=True
+        ):
+            humanizacion_rows.setdefault(h_row[0], h_row)
+
+        for row in ws_rejillas.iter_rows(
+            min_row=2, max_col=REJILLAS_PATTERN_COLS.stop, values_only=True
+        ):
+            id_patron = row[0]
             if not id_patron:
                 continue
 
-            inst_name = ws_rejillas.cell(row=row, column=2).value
+            inst_name = row[1]
 
             # Leer patron (columnas 3-18)
-            pattern = []
-            for col in range(3, 19):
-                val = ws_rejillas.cell(row=row, column=col).value
-                pattern.append(int(val) if val else 0)
+            pattern = [int(val) if val else 0 for val in row[REJILLAS_PATTERN_COLS]]
 
             # Buscar velocidades y timing en HUMANIZACION
             velocities = [0] * 16
             timing_devs = [0.0] * 16
 
-            for h_row in range(2, ws_humanizacion.max_row + 1):
-                h_id = ws_humanizacion.cell(row=h_row, column=1).value
-                if h_id == id_patron:
-                    for i in range(16):
-                        v = ws_humanizacion.cell(row=h_row, column=3 + i).value
-                        velocities[i] = int(v) if v else 0
-                        t = ws_humanizacion.cell(row=h_row, column=19 + i).value
-                        timing_devs[i] = float(t) if t else 0.0
-                    break
+            h_row = humanizacion_rows.get(id_patron)
+            if h_row is not None:
+                velocities = [int(v) if v else 0 for v in h_row[HUMANIZACION_VEL_COLS]]
+                timing_devs = [float(t) if t else 0.0 for t in h_row[HUMANIZACION_TIMING_COLS]]
 
             # Agregar al instrumento
             if inst_name not in instruments_data:
@@ -1,7 +1,9 @@
 """Groove Extractor - Orquestador principal del pipeline de analisis."""
 import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import librosa
+import soundfile as sf
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, List, Dict
@@ -19,6 +21,38 @@ from .exporters import ExcelExporter
 from .separators import DrumSeparator, SeparatedStems
 
 
+# style_hint de detect_bpm_only -> JamaicanStyle
+_STYLE_HINTS = {
+    "ska": JamaicanStyle.SKA,
+    "rocksteady": JamaicanStyle.ROCKSTEADY,
+    "early_reggae": JamaicanStyle.EARLY_REGGAE,
+    "roots": JamaicanStyle.ONE_DROP,
+    "one_drop": JamaicanStyle.ONE_DROP,
+    "steppers": JamaicanStyle.STEPPERS,
+    "dub": JamaicanStyle.DUB,
+}
+
+
+def _load_audio(audio_path: str, sr: int = 22050):
+    """
+    Carga audio mono float32 al sample rate indicado.
+
+    Lee el archivo entero de una vez con soundfile y solo remuestrea si el
+    sample rate nativo es distinto. Para formatos que libsndfile no soporta
+    se usa librosa.load.
+    """
+    try:
+        y, sr_native = sf.read(str(audio_path), dtype='float32', always_2d=True)
+    except (RuntimeError, sf.SoundFileError):
+        return librosa.load(str(audio_path), sr=sr)
+
+    # (n_samples, n_canales) -> mono
+    y = np.ascontiguousarray(y.mean(axis=1)) if y.shape[1] > 1 else y[:, 0]
+    if sr_native != sr:
+        y = librosa.resample(y, orig_sr=sr_native, target_sr=sr)
+    return y, sr
+
+
 @dataclass
 class ExtractorConfig:
     """Configuracion del extractor."""
@@ -94,7 +128,7 @@ class GrooveExtractor:
 
         # 1. Cargar audio
         print(f"[ANÁLISIS] Cargando audio: {audio_path.name}...")
-        y, sr = librosa.load(str(audio_path), sr=22050)
+        y, sr = _load_audio(audio_path, sr=22050)
         duration_sec = len(y) / sr
         print(f"[ANÁLISIS] Audio cargado: {duration_sec:.1f}s, {sr}Hz")
 
@@ -116,7 +150,6 @@ class GrooveExtractor:
             print(f"[ANÁLISIS] Stems guardados: {list(saved_files.keys())}")
             # Combinar kick + snare + hihat como "drums"
             if stems.kick is not None and stems.snare is not None:
-                import soundfile as sf
                 drums_combined = stems.kick + stems.snare
                 if stems.hihat is not None:
                     drums_combined = drums_combined + stems.hihat
@@ -127,16 +160,20 @@ class GrooveExtractor:
             # Sin separacion: usar audio completo para cada analisis
             stems = SeparatedStems(kick=y, snare=y, hihat=y, sr=sr)
 
-        # 3. Detectar BPM y estilo (usando style_hint si se proporciono)
+        # 3. Detectar onsets de los tres instrumentos (una sola vez)
+        print("[ANÁLISIS] Detectando onsets...")
+        onsets = self._detect_onsets(y, stems)
+
+        # 4. Detectar BPM y estilo (usando style_hint si se proporciono)
         print("[ANÁLISIS] Detectando BPM y estilo...")
-        bpm_result = self._analyze_bpm(y, stems, style_hint)
+        bpm_result = self._analyze_bpm(y, onsets['kick'], onsets['snare'], style_hint)
         print(f"[ANÁLISIS] BPM detectado: {bpm_result.bpm_detected:.1f} → corregido: {bpm_result.bpm_corrected:.1f} ({bpm_result.style_suggested.value})")
 
-        # 4. Inicializar timing converter con BPM detectado
+        # 5. Inicializar timing converter con BPM detectado
         self.timing_converter = TimingConverter(bpm=bpm_result.bpm_corrected)
         print(f"[ANÁLISIS] Convertido a ticks (480 PPQ, {self.timing_converter.ticks_per_bar} ticks/compás)")
 
-        # 5. Crear GrooveData base
+        # 6. Crear GrooveData base
         groove = GrooveData(
             song_name=audio_path.stem,
             bpm=bpm_result.bpm_corrected,
@@ -146,20 +183,20 @@ class GrooveExtractor:
             separated_drums_path=separated_drums_path
         )
 
-        # 6. Procesar cada instrumento
-        print("[ANÁLISIS] Detectando onsets...")
-        self._process_kick(groove, stems.kick if stems.kick is not None else y)
-        self._process_snare(groove, stems.snare if stems.snare is not None else y)
-        self._process_hihat(groove, stems.hihat if stems.hihat is not None else y)
+        # 7. Procesar cada instrumento
+        self._process_kick(groove, onsets['kick'])
+        self._process_snare(groove, onsets['snare'])
+        self._process_hihat(groove, stems.hihat if stems.hihat is not None else y,
+                            onsets['hihat'])
 
-        # 7. Calcular swing desde hi-hats
+        # 8. Calcular swing desde hi-hats
         if 'hihat' in groove.instruments:
             hihat_onsets = groove.instruments['hihat'].onsets
             groove.swing = self.swing_calculator.calculate_from_onsets(hihat_onsets)
             if groove.swing:
                 print(f"[ANÁLISIS] Swing calculado: {groove.swing.swing_percentage:.1f}%")
 
-        # 8. Exportar a Excel si esta configurado
+        # 9. Exportar a Excel si esta configurado
         if self.config.export_excel and self.exporter is not None:
             if output_path is None:
                 output_path = str(audio_path.with_suffix('.xlsx'))
@@ -171,38 +208,47 @@ class GrooveExtractor:
 
         return groove
 
-    def _analyze_bpm(self, y: np.ndarray, stems: SeparatedStems,
+    def _detect_onsets(self, y: np.ndarray, stems: SeparatedStems) -> Dict[str, OnsetList]:
+        """
+        Detecta onsets de kick, snare y hihat en paralelo.
+
+        Las tres detecciones son independientes entre si y el trabajo pesado
+        (STFT, onset strength) se hace en numpy/librosa, por lo que un pool
+        de threads basta para solaparlas.
+        """
+        jobs = {
+            'kick': (self.onset_detector.detect_kick,
+                     stems.kick if stems.kick is not None else y),
+            'snare': (self.onset_detector.detect_snare,
+                      stems.snare if stems.snare is not None else y),
+            'hihat': (self.onset_detector.detect_hihat,
+                      stems.hihat if stems.hihat is not None else y),
+        }
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = {name: pool.submit(detect, audio)
+                       for name, (detect, audio) in jobs.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _analyze_bpm(self, y: np.ndarray, kick_onsets: OnsetList, snare_onsets: OnsetList,
                      style_hint: Optional[JamaicanStyle] = None):
         """Analiza BPM usando patron de kick/snare si disponible."""
-        # Detectar onsets para analisis de patron
-        kick_onsets = self.onset_detector.detect_kick(
-            stems.kick if stems.kick is not None else y
-        )
-        snare_onsets = self.onset_detector.detect_snare(
-            stems.snare if stems.snare is not None else y
-        )
-
         # Usar analyze_with_pattern para deteccion inteligente
         return self.bpm_analyzer.analyze_with_pattern(
             y, kick_onsets.times, snare_onsets.times, style_hint
         )
 
-    def _process_kick(self, groove: GrooveData, y: np.ndarray):
+    def _process_kick(self, groove: GrooveData, onsets: OnsetList):
         """Procesa onsets de bombo."""
-        onsets = self.onset_detector.detect_kick(y)
         print(f"[ANÁLISIS] Onsets kick: {len(onsets)} detectados")
         self._add_instrument_data(groove, 'kick', onsets)
 
-    def _process_snare(self, groove: GrooveData, y: np.ndarray):
+    def _process_snare(self, groove: GrooveData, onsets: OnsetList):
         """Procesa onsets de caja."""
-        onsets = self.onset_detector.detect_snare(y)
         print(f"[ANÁLISIS] Onsets snare: {len(onsets)} detectados")
         self._add_instrument_data(groove, 'snare', onsets)
 
-    def _process_hihat(self, groove: GrooveData, y: np.ndarray):
+    def _process_hihat(self, groove: GrooveData, y: np.ndarray, onsets: OnsetList):
         """Procesa onsets de hi-hat con clasificacion opcional."""
-        onsets = self.onset_detector.detect_hihat(y)
-
         # Clasificar hi-hats si esta configurado
         open_count = 0
         closed_count = 0
@@ -352,7 +398,7 @@ def detect_bpm_only(audio_path: str, style_hint: Optional[str] = None) -> BPMRes
     from .models import suggest_bpm_correction, suggest_style_from_bpm
 
     # Cargar audio
-    y, sr = librosa.load(str(audio_path), sr=22050)
+    y, sr = _load_audio(audio_path, sr=22050)
 
     # Crear analizador
     analyzer = JamaicanBPMAnalyzer(sr=sr)
@@ -366,16 +412,7 @@ def detect_bpm_only(audio_path: str, style_hint: Optional[str] = None) -> BPMRes
 
     if style_hint:
         # Mapear style_hint a JamaicanStyle
-        style_map = {
-            "ska": JamaicanStyle.SKA,
-            "rocksteady": JamaicanStyle.ROCKSTEADY,
-            "early_reggae": JamaicanStyle.EARLY_REGGAE,
-            "roots": JamaicanStyle.ONE_DROP,
-            "one_drop": JamaicanStyle.ONE_DROP,
-            "steppers": JamaicanStyle.STEPPERS,
-            "dub": JamaicanStyle.DUB,
-        }
-        hint_style = style_map.get(style_hint.lower())
+        hint_style = _STYLE_HINTS.get(style_hint.lower())
 
         if hint_style:
             # Aplicar correccion basada en el hint
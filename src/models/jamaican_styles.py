@@ -38,6 +38,12 @@ STYLE_BPM_RANGES = {
     JamaicanStyle.DUB: StyleBPMRange(JamaicanStyle.DUB, 60, 90, 75),
 }
 
+# Estilos reggae que a menudo se detectan al doble de tempo
+_REGGAE_STYLES = frozenset({
+    JamaicanStyle.ONE_DROP, JamaicanStyle.ROCKERS,
+    JamaicanStyle.STEPPERS, JamaicanStyle.ROOTS_REGGAE, JamaicanStyle.DUB
+})
+
 
 def suggest_style_from_bpm(bpm: float) -> Tuple[JamaicanStyle, float]:
     """Sugiere estilo basado en BPM. Devuelve (estilo, confianza)."""
@@ -73,12 +79,7 @@ def suggest_bpm_correction(bpm: float, detected_style: JamaicanStyle) -> Tuple[f
     corrected = bpm
 
     # Si es estilo reggae pero BPM > 130, probablemente esta al doble
-    reggae_styles = {
-        JamaicanStyle.ONE_DROP, JamaicanStyle.ROCKERS,
-        JamaicanStyle.STEPPERS, JamaicanStyle.ROOTS_REGGAE, JamaicanStyle.DUB
-    }
-
-    if detected_style in reggae_styles and bpm > 130:
+    if detected_style in _REGGAE_STYLES and bpm > 130:
         corrected = bpm / 2
         correction_type = "halved"
 
@@ -1,4 +1,5 @@
 """Analisis de swing."""
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Dict, Tuple
 from .jamaican_styles import JamaicanStyle
@@ -11,6 +12,16 @@ class SwingConfig:
     tolerance_ms: float = 10.0  # Tolerancia para considerar "on grid"
 
 
+# Umbrales de swing (%) y descripcion de cada tramo
+_SWING_THRESHOLDS = (52, 58, 64)
+_SWING_DESCRIPTIONS = (
+    "Straight (sin swing)",
+    "Swing ligero",
+    "Swing moderado",
+    "Shuffle/swing pesado",
+)
+
+
 @dataclass
 class SwingAnalysis:
     """Resultado de analisis de swing."""
@@ -22,14 +33,9 @@ class SwingAnalysis:
 
     def __post_init__(self):
         if not self.description:
-            if self.swing_percentage < 52:
-                self.description = "Straight (sin swing)"
-            elif self.swing_percentage < 58:
-                self.description = "Swing ligero"
-            elif self.swing_percentage < 64:
-                self.description = "Swing moderado"
-            else:
-                self.description = "Shuffle/swing pesado"
+            self.description = _SWING_DESCRIPTIONS[
+                bisect_right(_SWING_THRESHOLDS, self.swing_percentage)
+            ]
 
 
 # Rangos de swing tipicos por estilo
@@ -37,6 +37,12 @@ except ImportError:
 MODEL_DEMUCS = "htdemucs_ft.yaml"  # Para extraer drums de mezcla
 MODEL_DRUMSEP = "MDX23C-DrumSep-aufr33-jarredou.ckpt"  # Para separar kick/snare/hihat
 
+# Bandas de frecuencia del fallback (Hz), en orden kick, snare, hihat
+FREQUENCY_BANDS = np.array(
+    [('kick', 20, 150), ('snare', 150, 5000), ('hihat', 5000, 16000)],
+    dtype=[('name', 'U8'), ('low', 'f4'), ('high', 'f4')]
+)
+
 
 @dataclass
 class SeparatedStems:
@@ -562,20 +568,13 @@ class DrumSeparator:
         D = librosa.stft(y)
         freqs = librosa.fft_frequencies(sr=sr)
 
-        # Mascaras de frecuencia
-        kick_mask = (freqs >= 20) & (freqs <= 150)
-        snare_mask = (freqs >= 150) & (freqs <= 5000)
-        hihat_mask = (freqs >= 5000) & (freqs <= 16000)
-
-        # Aplicar mascaras
-        D_kick = D * kick_mask[:, np.newaxis]
-        D_snare = D * snare_mask[:, np.newaxis]
-        D_hihat = D * hihat_mask[:, np.newaxis]
+        # Mascaras de todas las bandas de una vez: (n_bandas, n_freqs)
+        masks = ((freqs >= FREQUENCY_BANDS['low'][:, np.newaxis]) &
+                 (freqs <= FREQUENCY_BANDS['high'][:, np.newaxis]))
 
-        # Reconstruir audio
-        kick = librosa.istft(D_kick)
-        snare = librosa.istft(D_snare)
-        hihat = librosa.istft(D_hihat)
+        # Aplicar mascaras y reconstruir las tres bandas en una sola istft
+        D_bands = D[np.newaxis, :, :] * masks[:, :, np.newaxis]
+        kick, snare, hihat = librosa.istft(D_bands)
 
         return SeparatedStems(
             kick=kick,
@@ -52,7 +52,7 @@ class AnalysisThread(QThread):
 
     progress = pyqtSignal(int)
     status = pyqtSignal(str)  # Para mensajes de log
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal()  # Resultados en self.results
     error = pyqtSignal(str)
     bpm_detected = pyqtSignal(float, str)
     drums_separated = pyqtSignal(str)  # Ruta al archivo de batería separada
@@ -73,6 +73,7 @@ class AnalysisThread(QThread):
         )
         self.extractor = GrooveExtractor(self.config, progress_callback=self._on_progress)
         self.groove_data = None
+        self.results = None
         self.separated_drums_path = None
 
     def _on_progress(self, message: str):
@@ -116,7 +117,7 @@ class AnalysisThread(QThread):
 
             # Convertir groove_data a dict directamente (sin re-extraer)
             groove = self.groove_data
-            results = {
+            self.results = {
                 'song_name': groove.song_name,
                 'bpm': groove.bpm,
                 'style': groove.style.value,
@@ -145,7 +146,7 @@ class AnalysisThread(QThread):
 
             self.progress.emit(100)
             self.status.emit("Amaituta!")
-            self.finished.emit(results)
+            self.finished.emit()
 
         except Exception as e:
             self.error.emit(str(e))
@@ -847,7 +848,10 @@ class MainWindow(QMainWindow):
         """Actualiza el log de proceso."""
         self.screen_log.set_text(message)
 
-    def _on_analysis_finished(self, results: dict):
+    def _on_analysis_finished(self):
+        # El thread guarda los resultados; no viajan en la señal
+        results = self.analysis_thread.results
+
         self.led_kick.turn_off()
         self.led_snare.turn_off()
         self.led_hihat.turn_off()